@@ -6,6 +6,7 @@ import inspect
 import json
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable, Sequence
+from functools import lru_cache
 from typing import Any
 
 import pydantic_core
@@ -28,6 +29,12 @@ from fastmcp.utilities.types import (
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=5000)
+def _get_signature(fn: Callable[..., Any]) -> inspect.Signature:
+    """Prompt functions are introspected on every render, so cache signatures."""
+    return inspect.signature(fn)
+
+
 def Message(
     content: str | ContentBlock, role: Role | None = None, **kwargs: Any
 ) -> PromptMessage:
@@ -262,7 +269,7 @@ class FunctionPrompt(Prompt):
         """Convert string arguments to expected types based on function signature."""
         from fastmcp.server.context import Context
 
-        sig = inspect.signature(self.fn)
+        sig = _get_signature(self.fn)
         converted_kwargs = {}
 
         # Find context parameter name if any
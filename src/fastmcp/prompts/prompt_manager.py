@@ -161,11 +161,9 @@ class PromptManager:
         filtered protocol path.
         """
         # 1. Check local prompts first. The server will have already applied its filter.
-        if name in self._prompts:
-            prompt = await self.get_prompt(name)
-            if not prompt:
-                raise NotFoundError(f"Unknown prompt: {name}")
-
+        # Local prompts always take precedence, so there's no need to load the
+        # mounted inventory to find one.
+        if prompt := self._prompts.get(name):
             try:
                 messages = await prompt.render(arguments)
                 return GetPromptResult(
@@ -191,8 +189,9 @@ class PromptManager:
         for mounted in reversed(self._mounted_servers):
             prompt_key = name
             if mounted.prefix:
-                if name.startswith(f"{mounted.prefix}_"):
-                    prompt_key = name.removeprefix(f"{mounted.prefix}_")
+                prefix = f"{mounted.prefix}_"
+                if name.startswith(prefix):
+                    prompt_key = name.removeprefix(prefix)
                 else:
                     continue
             try:
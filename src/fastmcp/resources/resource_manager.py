@@ -422,11 +422,9 @@ class ResourceManager:
         uri_str = str(uri)
 
         # 1. Check local resources first. The server will have already applied its filter.
-        if uri_str in self._resources:
-            resource = await self.get_resource(uri_str)
-            if not resource:
-                raise NotFoundError(f"Resource {uri_str!r} not found")
-
+        # Local resources always take precedence, so there's no need to load the
+        # mounted inventory to find one.
+        if resource := self._resources.get(uri_str):
             try:
                 return await resource.read()
 
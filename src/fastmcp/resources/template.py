@@ -5,6 +5,7 @@ from __future__ import annotations
 import inspect
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 from urllib.parse import unquote
 
@@ -26,7 +27,12 @@ from fastmcp.utilities.types import (
 )
 
 
+@lru_cache(maxsize=5000)
 def build_regex(template: str) -> re.Pattern:
+    """
+    Compile a URI template into a regex. Every resource read tries each
+    registered template, so compiled patterns are cached per template string.
+    """
     parts = re.split(r"(\{[^}]+\})", template)
     pattern = ""
     for part in parts:
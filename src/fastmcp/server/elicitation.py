@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Generic, Literal
 
 from mcp.server.elicitation import (
@@ -28,6 +30,9 @@ logger = get_logger(__name__)
 
 T = TypeVar("T", default=Any)
 
+# JSON schema types permitted for elicitation properties
+_ALLOWED_TYPES = frozenset({"string", "number", "integer", "boolean"})
+
 
 class ElicitationJsonSchema(GenerateJsonSchema):
     """Custom JSON schema generator for MCP elicitation that always inlines enums.
@@ -102,7 +107,12 @@ def get_elicitation_schema(response_type: type[T]) -> dict[str, Any]:
     Args:
         response_type: The type of the response
     """
+    # Return a copy so callers can't mutate the cached schema
+    return copy.deepcopy(_get_elicitation_schema(response_type))
+
 
+@lru_cache(maxsize=5000)
+def _get_elicitation_schema(response_type: type[T]) -> dict[str, Any]:
     # Use custom schema generator that inlines enums for MCP compatibility
     schema = get_cached_typeadapter(response_type).json_schema(
         schema_generator=ElicitationJsonSchema
@@ -131,8 +141,6 @@ def validate_elicitation_json_schema(schema: dict[str, Any]) -> None:
     Raises:
         TypeError: If the schema doesn't meet MCP elicitation requirements
     """
-    ALLOWED_TYPES = {"string", "number", "integer", "boolean"}
-
     # Check that the schema is an object
     if schema.get("type") != "object":
         raise TypeError(
@@ -174,7 +182,7 @@ def validate_elicitation_json_schema(schema: dict[str, Any]) -> None:
                     continue
                 # If the referenced definition has a type that's allowed, it's allowed
                 ref_type = ref_def.get("type")
-                if ref_type in ALLOWED_TYPES:
+                if ref_type in _ALLOWED_TYPES:
                     continue
             # If we can't determine what the ref points to, reject it for safety
             raise TypeError(
@@ -190,18 +198,18 @@ def validate_elicitation_json_schema(schema: dict[str, Any]) -> None:
                 if "const" in union_schema or "enum" in union_schema:
                     continue
                 union_type = union_schema.get("type")
-                if union_type not in ALLOWED_TYPES:
+                if union_type not in _ALLOWED_TYPES:
                     raise TypeError(
                         f"Elicitation schema field '{prop_name}' has union type '{union_type}' which is not "
-                        f"a primitive type. Only {ALLOWED_TYPES} are allowed in elicitation schemas."
+                        f"a primitive type. Only {sorted(_ALLOWED_TYPES)} are allowed in elicitation schemas."
                     )
             continue
 
         # Check if it's a primitive type
-        if prop_type not in ALLOWED_TYPES:
+        if prop_type not in _ALLOWED_TYPES:
             raise TypeError(
                 f"Elicitation schema field '{prop_name}' has type '{prop_type}' which is not "
-                f"a primitive type. Only {ALLOWED_TYPES} are allowed in elicitation schemas."
+                f"a primitive type. Only {sorted(_ALLOWED_TYPES)} are allowed in elicitation schemas."
             )
 
         # Check for nested objects or arrays of objects (not allowed)
@@ -400,6 +400,9 @@ class FastMCP(Generic[LifespanResultT]):
         call_next: Callable[[MiddlewareContext[Any]], Awaitable[Any]],
     ) -> Any:
         """Builds and executes the middleware chain."""
+        if not self.middleware:
+            return await call_next(context)
+
         chain = call_next
         for mw in reversed(self.middleware):
             chain = partial(mw, call_next=chain)
@@ -2335,13 +2338,12 @@ def remove_resource_prefix(
         protocol, path = match.groups()
 
         # Check if the path starts with the prefix followed by a /
-        prefix_pattern = f"^{re.escape(prefix)}/(.*?)$"
-        path_match = re.match(prefix_pattern, path)
-        if not path_match:
+        path_prefix = f"{prefix}/"
+        if not path.startswith(path_prefix):
             return uri
 
         # Return the URI without the prefix
-        return f"{protocol}{path_match.group(1)}"
+        return f"{protocol}{path[len(path_prefix) :]}"
     else:
         raise ValueError(f"Invalid prefix format: {prefix_format}")
 
@@ -2402,7 +2404,6 @@ def has_resource_prefix(
         _, path = match.groups()
 
         # Check if the path starts with the prefix followed by a /
-        prefix_pattern = f"^{re.escape(prefix)}/"
-        return bool(re.match(prefix_pattern, path))
+        return path.startswith(f"{prefix}/")
     else:
         raise ValueError(f"Invalid prefix format: {prefix_format}")
@@ -98,6 +98,26 @@ class ToolResult:
         return self.content, self.structured_content
 
 
+# there are a variety of types that we don't want to attempt to serialize
+# because they are either used by FastMCP internally, or are MCP content types
+# that explicitly don't form structured content. Replacing them with an
+# explicitly unserializable type ensures no output schema is generated.
+_UNSERIALIZABLE_TYPE_MAP: dict[type, type] = {
+    t: _UnserializableType
+    for t in (
+        Image,
+        Audio,
+        File,
+        ToolResult,
+        mcp.types.TextContent,
+        mcp.types.ImageContent,
+        mcp.types.AudioContent,
+        mcp.types.ResourceLink,
+        mcp.types.EmbeddedResource,
+    )
+}
+
+
 class Tool(FastMCPComponent):
     """Internal tool registration info."""
 
@@ -420,28 +440,9 @@ class ParsedFunction:
                 pass
 
         if output_type not in (inspect._empty, None, Any, ...):
-            # there are a variety of types that we don't want to attempt to
-            # serialize because they are either used by FastMCP internally,
-            # or are MCP content types that explicitly don't form structured
-            # content. By replacing them with an explicitly unserializable type,
-            # we ensure that no output schema is automatically generated.
-            clean_output_type = replace_type(
-                output_type,
-                {
-                    t: _UnserializableType
-                    for t in (
-                        Image,
-                        Audio,
-                        File,
-                        ToolResult,
-                        mcp.types.TextContent,
-                        mcp.types.ImageContent,
-                        mcp.types.AudioContent,
-                        mcp.types.ResourceLink,
-                        mcp.types.EmbeddedResource,
-                    )
-                },
-            )
+            # strip internal and MCP content types so they don't produce an
+            # output schema; see _UNSERIALIZABLE_TYPE_MAP
+            clean_output_type = replace_type(output_type, _UNSERIALIZABLE_TYPE_MAP)
 
             try:
                 type_adapter = get_cached_typeadapter(clean_output_type)
@@ -242,8 +242,9 @@ class ToolManager:
         for mounted in reversed(self._mounted_servers):
             tool_key = key
             if mounted.prefix:
-                if key.startswith(f"{mounted.prefix}_"):
-                    tool_key = key.removeprefix(f"{mounted.prefix}_")
+                prefix = f"{mounted.prefix}_"
+                if key.startswith(prefix):
+                    tool_key = key.removeprefix(prefix)
                 else:
                     continue
             try:
@@ -395,18 +395,23 @@ def _schema_to_type(
     return _get_from_type_handler(schema, schemas)(schema)
 
 
+_NON_IDENTIFIER_CHARS = re.compile(r"[^0-9a-zA-Z_]")
+_REPEATED_UNDERSCORES = re.compile(r"__+")
+_IDENTIFIER_START = re.compile(r"[a-zA-Z_]")
+
+
 def _sanitize_name(name: str) -> str:
     """Convert string to valid Python identifier."""
     original_name = name
     # Step 1: replace everything except [0-9a-zA-Z_] with underscores
-    cleaned = re.sub(r"[^0-9a-zA-Z_]", "_", name)
+    cleaned = _NON_IDENTIFIER_CHARS.sub("_", name)
     # Step 2: deduplicate underscores
-    cleaned = re.sub(r"__+", "_", cleaned)
+    cleaned = _REPEATED_UNDERSCORES.sub("_", cleaned)
     # Step 3: if the first char of original name isn't a letter or underscore, prepend field_
-    if not name or not re.match(r"[a-zA-Z_]", name[0]):
+    if not name or not _IDENTIFIER_START.match(name[0]):
         cleaned = f"field_{cleaned}"
     # Step 4: deduplicate again
-    cleaned = re.sub(r"__+", "_", cleaned)
+    cleaned = _REPEATED_UNDERSCORES.sub("_", cleaned)
     # Step 5: only strip trailing underscores if they weren't in the original name
     if not original_name.endswith("_"):
         cleaned = cleaned.rstrip("_")
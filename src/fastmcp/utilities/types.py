@@ -156,12 +156,28 @@ def find_kwarg_by_type(fn: Callable, kwarg_type: type) -> str | None:
 
     # Try to get resolved type hints
     try:
-        # Use include_extras=True to preserve Annotated metadata
-        type_hints = get_type_hints(fn, include_extras=True)
+        type_hints = _get_resolved_type_hints(fn)
     except Exception:
-        # If resolution fails, use raw annotations if they exist
+        # If the callable is unhashable or resolution fails, use raw annotations
         type_hints = getattr(fn, "__annotations__", {})
 
+    return _find_kwarg_in_hints(fn, type_hints, kwarg_type)
+
+
+@lru_cache(maxsize=5000)
+def _get_resolved_type_hints(fn: Callable) -> dict[str, Any]:
+    """
+    find_kwarg_by_type runs on every tool, resource, and prompt invocation, and
+    resolving type hints is expensive. Only successful resolutions are cached,
+    since lru_cache does not cache exceptions. Callers must not mutate the result.
+    """
+    # Use include_extras=True to preserve Annotated metadata
+    return get_type_hints(fn, include_extras=True)
+
+
+def _find_kwarg_in_hints(
+    fn: Callable, type_hints: dict[str, Any], kwarg_type: type
+) -> str | None:
     sig = inspect.signature(fn)
     for name, param in sig.parameters.items():
         # Use resolved hint if available, otherwise raw annotation
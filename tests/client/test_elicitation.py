@@ -717,3 +717,15 @@ def test_enum_elicitation_schema_with_enum_names():
         "Completed",
         "On Hold",
     ]
+
+
+def test_elicitation_schema_is_not_shared():
+    @dataclass
+    class Person:
+        name: str
+
+    schema = get_elicitation_schema(Person)
+    schema["properties"]["name"]["type"] = "integer"
+
+    # mutating a returned schema must not affect later calls
+    assert get_elicitation_schema(Person)["properties"]["name"]["type"] == "string"
@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from fastmcp import Context
 from fastmcp.resources import ResourceTemplate
 from fastmcp.resources.resource import FunctionResource
-from fastmcp.resources.template import match_uri_template
+from fastmcp.resources.template import build_regex, match_uri_template
 
 
 class TestResourceTemplate:
@@ -600,6 +600,14 @@ class TestMatchUriTemplate:
         result = match_uri_template(uri=uri, uri_template=uri_template)
         assert result == expected_params
 
+    def test_build_regex_is_cached(self):
+        """Test that templates are compiled once and reused across matches."""
+        uri_template = "test://cached/{x}"
+        assert match_uri_template("test://cached/foo", uri_template) == {"x": "foo"}
+        hits = build_regex.cache_info().hits
+        assert match_uri_template("test://cached/bar", uri_template) == {"x": "bar"}
+        assert build_regex.cache_info().hits == hits + 1
+
 
 class TestContextHandling:
     """Test context handling in resource templates."""
@@ -1,4 +1,6 @@
 import base64
+import functools
+import inspect
 import os
 import tempfile
 from pathlib import Path
@@ -13,6 +15,7 @@ from fastmcp.utilities.types import (
     Audio,
     File,
     Image,
+    _get_resolved_type_hints,
     find_kwarg_by_type,
     get_cached_typeadapter,
     is_class_member_of_type,
@@ -594,6 +597,68 @@ class TestFindKwargByType:
 
         assert find_kwarg_by_type(func, str) == "c"
 
+    def test_function_without_annotations(self):
+        """Test that a function with no annotations has no matching parameter."""
+
+        def func(a, b, c):
+            pass
+
+        assert find_kwarg_by_type(func, BaseClass) is None
+
+    def test_wrapped_function_without_annotations(self):
+        """Test that a wrapper without annotations uses the wrapped signature."""
+
+        def inner(x: int, ctx: BaseClass):
+            pass
+
+        @functools.wraps(inner)
+        def wrapper(*args, **kwargs):
+            pass
+
+        wrapper.__annotations__ = {}
+        assert find_kwarg_by_type(wrapper, BaseClass) == "ctx"
+
+    def test_function_with_explicit_signature(self):
+        """Test that a __signature__ override is used when there are no annotations."""
+
+        def func(*args, **kwargs):
+            pass
+
+        func.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+            [
+                inspect.Parameter(
+                    "ctx", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=BaseClass
+                )
+            ]
+        )
+        assert find_kwarg_by_type(func, BaseClass) == "ctx"
+
+    def test_repeated_lookups_are_cached(self):
+        """Test that repeated lookups for the same function reuse the cached result."""
+
+        def func(a: int, b: BaseClass):
+            pass
+
+        assert find_kwarg_by_type(func, BaseClass) == "b"
+        hits = _get_resolved_type_hints.cache_info().hits
+        assert find_kwarg_by_type(func, BaseClass) == "b"
+        assert _get_resolved_type_hints.cache_info().hits == hits + 1
+
+    def test_unresolvable_hints_are_retried(self):
+        """Test that a failed forward reference resolution is not cached."""
+        namespace: dict[str, Any] = {"BaseClass": BaseClass}
+        exec(
+            "def func(a: 'LaterDefinedClass', b: 'BaseClass'):\n    pass",
+            namespace,
+        )
+        func = namespace["func"]
+
+        # the raw annotation strings don't match until the reference resolves
+        assert find_kwarg_by_type(func, BaseClass) is None
+
+        namespace["LaterDefinedClass"] = OtherClass
+        assert find_kwarg_by_type(func, BaseClass) == "b"
+
 
 class TestReplaceType:
     @pytest.mark.parametrize(